@@ -1,183 +1,626 @@
-import requests
+import copy
+import httpx
+import orjson
+import random
+import re
 import time
 import logging
-from requests.exceptions import Timeout, RequestException
-from typing import Optional
+import math
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import quote
+from typing import Callable, Optional, Sequence
 
 # Configuration
 MAX_RETRIES = 3
 TIMEOUT_SECONDS = 2
 BASE_URL = "https://api.hyperliquid.xyz/info"
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 4.0
+RATE_LIMIT_COOLDOWN_SECONDS = 5
+RATE_LIMIT_MAX_SECONDS = 300
+ENDPOINT_DOWN_SECONDS = 10
 
 # Logger setup
 logger = logging.getLogger(__name__)
 
-# Global cache for last known prices (simple implementation)
-_last_known_prices = {}
+# Price cache windows (seconds): fresh entries skip the API entirely,
+# stale entries are only served as a fallback when the API fails
+T_FRESH = 2.0
+T_STALE = 60.0
+
+# Global price cache: symbol -> (price, time.monotonic() when fetched),
+# split into lock-protected shards so concurrent callers can share it
+_CACHE_SHARD_COUNT = 16
+_CACHE_SHARDS: list[tuple[dict[str, tuple[float, float]], threading.Lock]] = [
+    ({}, threading.Lock()) for _ in range(_CACHE_SHARD_COUNT)
+]
+
+# Fetches in progress, shared with concurrent callers asking for the same price
+_inflight: dict[tuple[str, bool], Future] = {}
+_inflight_lock = threading.Lock()
+
+# Rate limit circuit breaker: no requests are sent before this time.monotonic() value
+_rate_limit_until: float = 0.0
+
+# Endpoint health: after persistent server errors, fail fast until this time.monotonic() value
+_endpoint_down_until: float = 0.0
+
+
+def _make_client(transport: Optional[httpx.BaseTransport] = None) -> httpx.Client:
+    """Build the API client; tests pass a mock transport to get the same settings."""
+    return httpx.Client(
+        http2=True,
+        timeout=TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        headers={"User-Agent": "HyperLiquid-Price-Client/1.0"},
+        follow_redirects=True,  # as requests did; httpx does not follow redirects by default
+        transport=transport,
+    )
+
+
+# Shared HTTP/2 client: keeps TLS connections to the API alive across calls and
+# retries, and multiplexes concurrent requests over a single connection
+_CLIENT = _make_client()
+
+# Request body for the bulk mid-price endpoint, encoded once
+_ALL_MIDS_BODY = orjson.dumps({"type": "allMids"})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Plain decimal price string as reported by allMids: no sign, exponent, padding or underscores
+_DECIMAL_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+
+
+@lru_cache(maxsize=512)
+def _price_url(symbol: str) -> str:
+    """Build (once per symbol) the spot price URL, so the client skips param encoding."""
+    return f"{BASE_URL}?symbol={quote(symbol, safe='')}&type=spotPrice"
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, so clients don't retry in lockstep after an outage."""
+    base = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)))
+    return base * (0.5 + random.random())
+
+
+def _backoff(attempt: int) -> None:
+    """Wait before retrying after a failed attempt."""
+    time.sleep(_backoff_delay(attempt))
+
+
+def _retry_after_seconds(headers) -> Optional[int]:
+    """Parse the Retry-After header, in delta-seconds or HTTP-date form (RFC 7231 section 7.1.3)."""
+    retry_after = headers.get("Retry-After", "")
+    try:
+        seconds = int(retry_after)
+        return seconds if seconds >= 0 else None
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, math.ceil((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
+
+def _open_circuit(seconds: float) -> None:
+    """Stop sending requests for the given number of seconds, at most RATE_LIMIT_MAX_SECONDS."""
+    global _rate_limit_until
+    # Capped so a bogus Retry-After cannot block every price fetch indefinitely
+    seconds = min(seconds, RATE_LIMIT_MAX_SECONDS)
+    _rate_limit_until = max(_rate_limit_until, time.monotonic() + seconds)
+
+
+def _check_circuit(symbol: str) -> None:
+    """Raise RateLimitError without calling the API while the circuit is open."""
+    remaining = _rate_limit_until - time.monotonic()
+    if remaining > 0:
+        logger.warning("Rate limit circuit open, not requesting %s. Blocking trading.", symbol)
+        raise RateLimitError(
+            f"Rate limit circuit open for {symbol}. Retry after {math.ceil(remaining)} seconds",
+            retry_after=math.ceil(remaining),
+        )
+
+
+def reset_circuit() -> None:
+    """Close the rate limit circuit breaker and clear the endpoint-down flag."""
+    global _rate_limit_until, _endpoint_down_until
+    _rate_limit_until = 0.0
+    _endpoint_down_until = 0.0
+
+
+def _shard(symbol: str) -> tuple[dict[str, tuple[float, float]], threading.Lock]:
+    """Return the cache shard (entries, lock) holding symbol."""
+    return _CACHE_SHARDS[hash(symbol) & (_CACHE_SHARD_COUNT - 1)]
+
+
+def _cache_get(symbol: str) -> Optional[tuple[float, float]]:
+    """Return the cached (price, timestamp) for symbol, if any."""
+    entries, lock = _shard(symbol)
+    with lock:
+        return entries.get(symbol)
+
+
+def _cache_put(symbol: str, price: float) -> None:
+    """Cache a freshly fetched price for symbol."""
+    entries, lock = _shard(symbol)
+    with lock:
+        entries[symbol] = (price, time.monotonic())
+
+
+def clear_cache() -> None:
+    """Drop all cached prices."""
+    for entries, lock in _CACHE_SHARDS:
+        with lock:
+            entries.clear()
+
+
+def _stale_price(symbol: str) -> Optional[float]:
+    """Return the cached price for symbol if still within T_STALE, else None."""
+    cached = _cache_get(symbol)
+    if cached is not None and time.monotonic() - cached[1] < T_STALE:
+        return cached[0]
+    return None
 
 
 class HyperLiquidAPIError(Exception):
     """Base exception for API errors."""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(HyperLiquidAPIError):
     """Rate limit exception with retry-after information."""
+    __slots__ = ("retry_after",)
+    
     def __init__(self, message: str, retry_after: Optional[int] = None):
         super().__init__(message)
         self.retry_after = retry_after
+    
+    def __reduce__(self):
+        # Slots are not pickled by BaseException.__reduce__, so pass retry_after explicitly
+        return type(self), (*self.args, self.retry_after)
 
 
 class InvalidPriceDataError(HyperLiquidAPIError):
     """Invalid price data (negative, zero, non-numeric, missing)."""
-    pass
+    __slots__ = ()
 
 
 class RetryExhaustedError(HyperLiquidAPIError):
     """All retry attempts have been exhausted."""
-    pass
+    __slots__ = ()
 
 
-def get_hyperliquid_price(symbol: str, use_fallback: bool = False) -> float:
+class _NeedsSlowPath(Exception):
+    """The first attempt was not a plain 200 OK with a valid price."""
+    __slots__ = ("pending",)
+    
+    def __init__(self, pending):
+        super().__init__()
+        # Response or network error from the first attempt (None if no request was sent)
+        self.pending = pending
+
+
+def _check_endpoint(target: str) -> None:
+    """Raise RetryExhaustedError without calling the API while the endpoint is marked down."""
+    if time.monotonic() < _endpoint_down_until:
+        logger.warning("Endpoint marked down, not requesting %s", target)
+        raise RetryExhaustedError(f"Endpoint marked down, not requesting {target}")
+
+
+def _classify_response(status: int, headers, target: str, attempt: int) -> str:
     """
-    Fetch price from Hyperliquid API with robust error handling.
+    Decide what to do with one API response, for both the sync and async clients.
     
     Args:
-        symbol: Trading symbol (e.g., 'BTC', 'ETH')
-        use_fallback: If True, use last known price on invalid data (non-critical mode)
-                     If False, raise exception on invalid data (critical mode)
+        status: HTTP status code
+        headers: Response headers (read for Retry-After)
+        target: What is being fetched (e.g. 'BTC'), used in logs and errors
+        attempt: 1-based attempt number
     
     Returns:
-        float: Current price for the symbol
+        str: "ok" for 200 OK, "retry" for a server error worth retrying
     
     Raises:
-        RateLimitError: When rate limited (429)
-        InvalidPriceDataError: When price data is invalid
-        RetryExhaustedError: When all retry attempts fail
+        RateLimitError: When rate limited (429, or 5xx with Retry-After)
+        HyperLiquidAPIError: For client errors and unexpected status codes
+    """
+    global _endpoint_down_until
+    logger.debug("Attempt %s/%s: Status %s", attempt, MAX_RETRIES, status)
+    
+    # === SUCCESS (200) - TC01 ===
+    if status == 200:
+        _endpoint_down_until = 0.0
+        return "ok"
+    
+    # === RATE LIMIT (429) - TC04 ===
+    elif status == 429:
+        retry_seconds = _retry_after_seconds(headers)
+        # Retry-After: 0 means retry now; only a missing header falls back to the cooldown
+        _open_circuit(retry_seconds if retry_seconds is not None else RATE_LIMIT_COOLDOWN_SECONDS)
+        
+        error_msg = f"Rate limited for {target}"
+        if retry_seconds is not None:
+            error_msg += f". Retry after {retry_seconds} seconds"
+        
+        logger.warning("%s. Blocking trading.", error_msg)
+        raise RateLimitError(error_msg, retry_after=retry_seconds)
+    
+    # === SERVER ERROR (500-599) - TC02 ===
+    elif 500 <= status < 600:
+        logger.warning("Server error %s for %s (attempt %s/%s)", status, target, attempt, MAX_RETRIES)
+        
+        # Server asked us to back off: honor it instead of retrying
+        retry_seconds = _retry_after_seconds(headers)
+        if retry_seconds:
+            _open_circuit(retry_seconds)
+            error_msg = f"Server error {status} for {target}. Retry after {retry_seconds} seconds"
+            logger.warning("%s. Blocking trading.", error_msg)
+            raise RateLimitError(error_msg, retry_after=retry_seconds)
+        
+        # === RETRY EXHAUSTION - TC07 ===
+        # Persistent server errors: skip the retry chain for a while
+        if attempt >= MAX_RETRIES:
+            _endpoint_down_until = time.monotonic() + ENDPOINT_DOWN_SECONDS
+        return "retry"
+    
+    # === CLIENT ERROR (400-499) ===
+    elif 400 <= status < 500:
+        logger.error("Client error %s for %s. Blocking trading.", status, target)
+        raise HyperLiquidAPIError(f"Client error {status} for {target}")
+    
+    # === UNEXPECTED STATUS CODE ===
+    else:
+        logger.error("Unexpected status code %s for %s", status, target)
+        raise HyperLiquidAPIError(f"Unexpected status code: {status}")
+
+
+def _request_with_retries(send: Callable[[], httpx.Response], target: str) -> httpx.Response:
+    """
+    Send a request until the API answers 200 OK, retrying server and network errors.
+    
+    Args:
+        send: Performs one HTTP request against the API
+        target: What is being fetched (e.g. 'BTC'), used in logs and errors
+    
+    Returns:
+        httpx.Response: The 200 OK response
+    
+    Raises:
+        RateLimitError: When rate limited (429, 5xx with Retry-After, or while
+                        the circuit opened by a previous rate limit is still open)
+        RetryExhaustedError: When all retry attempts fail, or while the endpoint
+                             is marked down after persistent server errors
         HyperLiquidAPIError: For other API errors
     """
-    global _last_known_prices
     last_exception = None
     
-    logger.info(f"Fetching price for {symbol} (fallback enabled: {use_fallback})")
-    
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            # Make API request
-            response = requests.get(
-                BASE_URL,
-                params={"symbol": symbol, "type": "spotPrice"},
-                timeout=TIMEOUT_SECONDS,
-                headers={"User-Agent": "HyperLiquid-Price-Client/1.0"}
-            )
-            
-            logger.debug(f"Attempt {attempt}/{MAX_RETRIES}: Status {response.status_code}")
+            # === ENDPOINT DOWN OR CIRCUIT OPEN (fail fast, no API call) ===
+            _check_endpoint(target)
+            _check_circuit(target)
             
-            # === RATE LIMIT (429) - TC04 ===
-            if response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                retry_seconds = int(retry_after) if retry_after and retry_after.isdigit() else None
-                
-                error_msg = f"Rate limited for {symbol}"
-                if retry_seconds:
-                    error_msg += f". Retry after {retry_seconds} seconds"
-                
-                logger.warning(f"{error_msg}. Blocking trading.")
-                raise RateLimitError(error_msg, retry_after=retry_seconds)
-            
-            # === SUCCESS (200) - TC01 ===
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                except ValueError as e:
-                    # === INVALID JSON - TC06 ===
-                    logger.error(f"CRITICAL: Invalid JSON response for {symbol}. Blocking trading.")
-                    raise InvalidPriceDataError(f"Invalid JSON response for {symbol}: {e}")
-                
-                # Extract price field
-                price = data.get("price")
-                
-                # === MISSING PRICE FIELD - TC03 ===
-                if price is None:
-                    logger.warning(f"Missing price field in response for {symbol}")
-                    
-                    if use_fallback and symbol in _last_known_prices:
-                        fallback_price = _last_known_prices[symbol]
-                        logger.info(f"Using fallback price for {symbol}: {fallback_price}")
-                        return fallback_price
-                    else:
-                        logger.error(f"CRITICAL: No price data for {symbol}. Blocking trading.")
-                        raise InvalidPriceDataError(f"Missing price field for {symbol}")
-                
-                # === NON-NUMERIC PRICE - TC03 ===
-                if not isinstance(price, (int, float)):
-                    logger.error(f"CRITICAL: Price not numeric for {symbol}: {type(price)}. Blocking trading.")
-                    raise InvalidPriceDataError(f"Price not numeric for {symbol}: {price}")
-                
-                # === NEGATIVE OR ZERO PRICE - TC03 ===
-                if price <= 0:
-                    logger.error(f"CRITICAL: Invalid price value for {symbol}: {price}. Blocking trading.")
-                    raise InvalidPriceDataError(f"Invalid price value for {symbol}: {price}")
-                
-                # Valid price - update cache and return
-                price_float = float(price)
-                _last_known_prices[symbol] = price_float
-                logger.info(f"Successfully fetched price for {symbol}: {price_float}")
-                return price_float
-            
-            # === SERVER ERROR (500-599) - TC02 ===
-            if 500 <= response.status_code < 600:
-                logger.warning(f"Server error {response.status_code} for {symbol} (attempt {attempt}/{MAX_RETRIES})")
-                
-                if attempt < MAX_RETRIES:
-                    # Wait before retry (exponential backoff simplified)
-                    wait_time = attempt * 0.5
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    # === RETRY EXHAUSTION - TC07 ===
-                    last_exception = HyperLiquidAPIError(
-                        f"Server error {response.status_code} after {MAX_RETRIES} retries"
-                    )
-                    break
+            # Make API request
+            response = send()
             
-            # === CLIENT ERROR (400-499) ===
-            if 400 <= response.status_code < 500:
-                logger.error(f"Client error {response.status_code} for {symbol}. Blocking trading.")
-                raise HyperLiquidAPIError(f"Client error {response.status_code} for {symbol}")
+            status = response.status_code
+            if _classify_response(status, response.headers, target, attempt) == "ok":
+                return response
             
-            # === UNEXPECTED STATUS CODE ===
-            logger.error(f"Unexpected status code {response.status_code} for {symbol}")
-            raise HyperLiquidAPIError(f"Unexpected status code: {response.status_code}")
+            last_exception = HyperLiquidAPIError(
+                f"Server error {status} after {MAX_RETRIES} retries"
+            )
         
         # === NETWORK TIMEOUT - TC05 ===
-        except Timeout as e:
-            logger.warning(f"Timeout for {symbol} (attempt {attempt}/{MAX_RETRIES})")
+        except httpx.TimeoutException as e:
+            logger.warning("Timeout for %s (attempt %s/%s)", target, attempt, MAX_RETRIES)
             last_exception = e
-            
-            if attempt < MAX_RETRIES:
-                wait_time = attempt * 0.5
-                time.sleep(wait_time)
-                continue
-            break
         
         # === OTHER NETWORK ERRORS ===
-        except RequestException as e:
-            logger.warning(f"Network error for {symbol}: {e} (attempt {attempt}/{MAX_RETRIES})")
+        except httpx.RequestError as e:
+            logger.warning("Network error for %s: %s (attempt %s/%s)", target, e, attempt, MAX_RETRIES)
             last_exception = e
-            
-            if attempt < MAX_RETRIES:
-                wait_time = attempt * 0.5
-                time.sleep(wait_time)
-                continue
-            break
         
-        # === RATE LIMIT ERROR (bubble up immediately) ===
-        except RateLimitError:
-            raise  # Re-raise immediately, no retry for rate limits
+        # Server error or network failure: back off, then retry
+        if attempt < MAX_RETRIES:
+            _backoff(attempt)
     
     # === ALL RETRIES EXHAUSTED - TC02, TC05, TC07 ===
-    logger.error(f"CRITICAL: All {MAX_RETRIES} retries exhausted for {symbol}. Blocking trading.")
     raise RetryExhaustedError(
-        f"Failed to get price for {symbol} after {MAX_RETRIES} attempts"
-    ) from last_exception
\ No newline at end of file
+        f"Failed to get price for {target} after {MAX_RETRIES} attempts"
+    ) from last_exception
+
+
+def _decode_json(content: bytes, target: str):
+    """
+    Decode a 200 OK response body, raising InvalidPriceDataError on malformed JSON.
+    
+    Takes the raw bytes so callers skip their HTTP library's text decoding and
+    charset detection: the API always answers in UTF-8, which orjson reads directly.
+    """
+    try:
+        return orjson.loads(content)
+    except (orjson.JSONDecodeError, ValueError) as e:
+        # === INVALID JSON - TC06 ===
+        logger.error("CRITICAL: Invalid JSON response for %s. Blocking trading.", target)
+        raise InvalidPriceDataError(f"Invalid JSON response for {target}: {e}")
+
+
+def _validate_price(symbol: str, price) -> float:
+    """Convert a reported price to float, rejecting non-numeric (strings, bools), non-positive and non-finite values."""
+    if type(price) in (int, float) and 0 < price < math.inf:  # also rejects NaN
+        return float(price)
+    logger.error("CRITICAL: Invalid price for %s: %r. Blocking trading.", symbol, price)
+    raise InvalidPriceDataError(f"Invalid price for {symbol}: {price!r}")
+
+
+def _validate_mid(symbol: str, mid) -> float:
+    """Validate an allMids price, which the API reports as a plain decimal string (e.g. '45000.5')."""
+    if isinstance(mid, str) and _DECIMAL_RE.fullmatch(mid):
+        mid = float(mid)
+    return _validate_price(symbol, mid)
+
+
+def get_hyperliquid_price(symbol: str, use_fallback: bool = False) -> float:
+    """
+    Fetch price from Hyperliquid API with robust error handling.
+    
+    Args:
+        symbol: Trading symbol (e.g., 'BTC', 'ETH')
+        use_fallback: If True, use last known price on invalid data, rate limiting
+                     or exhausted retries, as long as it is younger than T_STALE
+                     (non-critical mode)
+                     If False, raise exception on invalid data (critical mode)
+    
+    Returns:
+        float: Current price for the symbol
+    
+    Raises:
+        RateLimitError: When rate limited (429, 5xx with Retry-After, or while
+                        the circuit opened by a previous rate limit is still open)
+        InvalidPriceDataError: When price data is invalid
+        RetryExhaustedError: When all retry attempts fail, or when waiting on an
+                             identical in-flight fetch times out
+        HyperLiquidAPIError: For other API errors
+    
+    Callers joining an in-flight fetch receive a new exception of the same type,
+    chained (__cause__) to the one raised in the fetching thread.
+    """
+    # === FRESH CACHE HIT (no API call) ===
+    cached = _cache_get(symbol)
+    if cached is not None and time.monotonic() - cached[1] < T_FRESH:
+        logger.debug("Serving cached price for %s: %s", symbol, cached[0])
+        return cached[0]
+    
+    # === SINGLE-FLIGHT: join an identical fetch already in progress ===
+    # Keyed on use_fallback too, so a critical caller never receives a stale fallback price
+    key = (symbol, use_fallback)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    
+    if not owner:
+        logger.debug("Waiting for in-flight fetch of %s", symbol)
+        try:
+            # exception() waits without raising, so the owner's exception instance
+            # (and its traceback) is never re-raised from several threads
+            error = future.exception(timeout=_max_fetch_seconds())
+        except FutureTimeoutError as e:
+            logger.error("CRITICAL: Timed out waiting for in-flight fetch of %s. Blocking trading.", symbol)
+            raise RetryExhaustedError(f"Timed out waiting for in-flight fetch of {symbol}") from e
+        if error is None:
+            return future.result()
+        raise _fresh_error(error, symbol) from error
+    
+    try:
+        price = _fetch_price(symbol, use_fallback)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(price)
+        return price
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _max_fetch_seconds() -> float:
+    """
+    Upper bound on one full fetch, used to time out callers waiting on it.
+    
+    httpx applies TIMEOUT_SECONDS to each phase (pool, connect, write, read) of
+    every attempt, and _backoff_delay waits at most 1.5x its base between attempts.
+    """
+    request_seconds = MAX_RETRIES * 4 * TIMEOUT_SECONDS
+    backoff_seconds = sum(
+        min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (attempt - 1))) * 1.5
+        for attempt in range(1, MAX_RETRIES)
+    )
+    return request_seconds + backoff_seconds
+
+
+def _fresh_error(error: BaseException, symbol: str) -> HyperLiquidAPIError:
+    """Build a new exception for a waiter from the error the fetch owner raised."""
+    if isinstance(error, HyperLiquidAPIError):
+        # Rebuilt from args (and retry_after), without the owner's traceback
+        return copy.copy(error)
+    return HyperLiquidAPIError(f"In-flight fetch of {symbol} failed: {error!r}")
+
+
+def _fetch_price(symbol: str, use_fallback: bool) -> float:
+    """Fetch and validate one price from the API (see get_hyperliquid_price)."""
+    logger.info("Fetching price for %s (fallback enabled: %s)", symbol, use_fallback)
+    try:
+        return _fast_price(symbol)
+    except _NeedsSlowPath as e:
+        return _slow_price(symbol, use_fallback, e.pending)
+
+
+def _fast_price(symbol: str) -> float:
+    """
+    Happy path: one request answered 200 OK with a valid price.
+    
+    Everything else (open circuits, network errors, other status codes, invalid
+    data) raises _NeedsSlowPath, handing the first attempt over to _slow_price.
+    """
+    now = time.monotonic()
+    if now < _rate_limit_until or now < _endpoint_down_until:
+        raise _NeedsSlowPath(None)
+    
+    try:
+        response = _CLIENT.get(_price_url(symbol))
+    except httpx.RequestError as e:
+        raise _NeedsSlowPath(e)
+    
+    if response.status_code != 200:
+        raise _NeedsSlowPath(response)
+    
+    try:
+        price = orjson.loads(response.content)["price"]
+    except (ValueError, TypeError, KeyError):
+        raise _NeedsSlowPath(response)
+    if type(price) not in (int, float) or not 0 < price < math.inf:
+        raise _NeedsSlowPath(response)
+    price = float(price)
+    
+    _cache_put(symbol, price)
+    logger.info("Successfully fetched price for %s: %s", symbol, price)
+    return price
+
+
+def _slow_price(symbol: str, use_fallback: bool, pending) -> float:
+    """
+    Full path: retries, rate limits, fallback and detailed validation errors.
+    
+    Args:
+        symbol: Trading symbol
+        use_fallback: See get_hyperliquid_price
+        pending: Response or network error from _fast_price's attempt, used as
+                 the first attempt instead of sending the request again
+    """
+    logger.info("Retrying/handling price fetch for %s", symbol)
+    
+    def send() -> httpx.Response:
+        nonlocal pending
+        if pending is None:
+            return _CLIENT.get(_price_url(symbol))
+        first, pending = pending, None
+        if isinstance(first, Exception):
+            raise first
+        return first
+    
+    try:
+        response = _request_with_retries(send, symbol)
+    except (RateLimitError, RetryExhaustedError):
+        stale_price = _stale_price(symbol) if use_fallback else None
+        if stale_price is not None:
+            logger.warning("Price unavailable for %s, serving stale price: %s", symbol, stale_price)
+            return stale_price
+        logger.error("CRITICAL: Could not fetch price for %s. Blocking trading.", symbol)
+        raise
+    
+    data = _decode_json(response.content, symbol)
+    if not isinstance(data, dict):
+        logger.error("CRITICAL: Unexpected price response for %s. Blocking trading.", symbol)
+        raise InvalidPriceDataError(f"Unexpected price response for {symbol}: {data!r}")
+    
+    # Extract price field
+    price = data.get("price")
+    
+    # === MISSING PRICE FIELD - TC03 ===
+    if price is None:
+        logger.warning("Missing price field in response for %s", symbol)
+        
+        fallback_price = _stale_price(symbol) if use_fallback else None
+        if fallback_price is not None:
+            logger.info("Using fallback price for %s: %s", symbol, fallback_price)
+            return fallback_price
+        else:
+            logger.error("CRITICAL: No price data for %s. Blocking trading.", symbol)
+            raise InvalidPriceDataError(f"Missing price field for {symbol}")
+    
+    # === NON-NUMERIC, NEGATIVE OR ZERO PRICE - TC03 ===
+    price_float = _validate_price(symbol, price)
+    
+    # Valid price - update cache and return
+    _cache_put(symbol, price_float)
+    logger.info("Successfully fetched price for %s: %s", symbol, price_float)
+    return price_float
+
+
+def get_hyperliquid_prices(symbols: Sequence[str]) -> dict[str, float]:
+    """
+    Fetch prices for several symbols with a single allMids request.
+    
+    Always runs in critical mode: if any requested symbol is missing or
+    invalid, no prices are returned.
+    
+    Args:
+        symbols: Trading symbols (e.g., ['BTC', 'ETH'])
+    
+    Returns:
+        dict: Mid price per requested symbol
+    
+    Raises:
+        TypeError: When symbols is a single string rather than a sequence of them
+        Same exceptions as get_hyperliquid_price
+    """
+    # A str is a Sequence[str] too, but would be fetched character by character
+    if isinstance(symbols, str):
+        raise TypeError(f"symbols must be a sequence of symbols, not a string: {symbols!r}")
+    
+    # === FRESH CACHE HIT (no API call) ===
+    now = time.monotonic()
+    prices = {}
+    for symbol in symbols:
+        cached = _cache_get(symbol)
+        if cached is None or now - cached[1] >= T_FRESH:
+            break
+        prices[symbol] = cached[0]
+    else:
+        logger.debug("Serving cached prices for %s", symbols)
+        return prices
+    
+    target = ", ".join(symbols)
+    logger.info("Fetching prices for %s", target)
+    
+    try:
+        response = _request_with_retries(
+            lambda: _CLIENT.post(BASE_URL, content=_ALL_MIDS_BODY, headers=_JSON_HEADERS),
+            target,
+        )
+    except (RateLimitError, RetryExhaustedError):
+        logger.error("CRITICAL: Could not fetch prices for %s. Blocking trading.", target)
+        raise
+    
+    mids = _decode_json(response.content, target)
+    if not isinstance(mids, dict):
+        logger.error("CRITICAL: Unexpected allMids response for %s. Blocking trading.", target)
+        raise InvalidPriceDataError(f"Unexpected allMids response for {target}")
+    
+    prices = {}
+    for symbol in symbols:
+        mid = mids.get(symbol)
+        
+        # === MISSING PRICE FIELD - TC03 ===
+        if mid is None:
+            logger.error("CRITICAL: No price data for %s. Blocking trading.", symbol)
+            raise InvalidPriceDataError(f"Missing price field for {symbol}")
+        
+        # === NON-NUMERIC, NEGATIVE OR ZERO PRICE - TC03 ===
+        prices[symbol] = _validate_mid(symbol, mid)
+    
+    for symbol, price in prices.items():
+        _cache_put(symbol, price)
+    logger.info("Successfully fetched prices for %s", target)
+    return prices
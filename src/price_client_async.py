@@ -0,0 +1,135 @@
+import asyncio
+import logging
+
+import aiohttp
+
+from .price_client import (
+    MAX_RETRIES,
+    TIMEOUT_SECONDS,
+    BASE_URL,
+    HyperLiquidAPIError,
+    InvalidPriceDataError,
+    RetryExhaustedError,
+    _backoff_delay,
+    _check_circuit,
+    _check_endpoint,
+    _classify_response,
+    _decode_json,
+    _validate_price,
+)
+
+# Logger setup
+logger = logging.getLogger(__name__)
+
+
+async def _fetch_price(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    symbol: str,
+) -> float:
+    """
+    Fetch a single price over a shared session.
+
+    Shares the sync client's status handling, rate limit circuit breaker and
+    endpoint-down flag, without the last-known-price fallback (batch callers
+    always run in critical mode).
+    """
+    last_exception = None
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            async with semaphore:
+                # Checked after acquiring the semaphore: a 429 or a down endpoint
+                # seen by another request while this one was queued must stop it too
+                _check_endpoint(symbol)
+                _check_circuit(symbol)
+
+                async with session.get(
+                    BASE_URL,
+                    params={"symbol": symbol, "type": "spotPrice"},
+                ) as response:
+                    status = response.status
+                    if _classify_response(status, response.headers, symbol, attempt) == "ok":
+                        # === INVALID JSON - TC06 ===
+                        data = _decode_json(await response.read(), symbol)
+                        if not isinstance(data, dict):
+                            logger.error("CRITICAL: Unexpected price response for %s. Blocking trading.", symbol)
+                            raise InvalidPriceDataError(f"Unexpected price response for {symbol}: {data!r}")
+
+                        price = data.get("price")
+
+                        # === MISSING PRICE FIELD - TC03 ===
+                        if price is None:
+                            logger.error("CRITICAL: No price data for %s. Blocking trading.", symbol)
+                            raise InvalidPriceDataError(f"Missing price field for {symbol}")
+
+                        # === NON-NUMERIC, NEGATIVE OR ZERO PRICE - TC03 ===
+                        price_float = _validate_price(symbol, price)
+                        logger.info("Successfully fetched price for %s: %s", symbol, price_float)
+                        return price_float
+
+                    last_exception = HyperLiquidAPIError(
+                        f"Server error {status} after {MAX_RETRIES} retries"
+                    )
+
+        # === NETWORK TIMEOUT - TC05 ===
+        except asyncio.TimeoutError as e:
+            logger.warning("Timeout for %s (attempt %s/%s)", symbol, attempt, MAX_RETRIES)
+            last_exception = e
+
+        # === OTHER NETWORK ERRORS ===
+        except aiohttp.ClientError as e:
+            logger.warning("Network error for %s: %s (attempt %s/%s)", symbol, e, attempt, MAX_RETRIES)
+            last_exception = e
+
+        # Server error or network failure: wait outside the semaphore, then retry
+        if attempt < MAX_RETRIES:
+            await asyncio.sleep(_backoff_delay(attempt))
+
+    # === ALL RETRIES EXHAUSTED - TC02, TC05, TC07 ===
+    logger.error("CRITICAL: All %s retries exhausted for %s. Blocking trading.", MAX_RETRIES, symbol)
+    raise RetryExhaustedError(
+        f"Failed to get price for {symbol} after {MAX_RETRIES} attempts"
+    ) from last_exception
+
+
+async def get_prices(symbols: list[str], concurrency: int = 10) -> dict[str, float]:
+    """
+    Fetch prices for several symbols concurrently over one connection pool.
+
+    Args:
+        symbols: Trading symbols (e.g., ['BTC', 'ETH'])
+        concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        dict: Price per requested symbol
+
+    Raises:
+        The first error raised for any symbol (same exceptions as
+        get_hyperliquid_price). No partial result is returned, since
+        trading must be blocked if any required price is untrusted.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT_SECONDS)
+
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={"User-Agent": "HyperLiquid-Price-Client/1.0"},
+    ) as session:
+        results = await asyncio.gather(
+            *(_fetch_price(session, semaphore, symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    return dict(zip(symbols, results))
+
+
+def get_prices_sync(symbols: list[str]) -> dict[str, float]:
+    """Blocking wrapper around get_prices for callers without an event loop."""
+    return asyncio.run(get_prices(symbols))
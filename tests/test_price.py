@@ -1,9 +1,21 @@
+import orjson
+import pickle
 import pytest
-import requests
+import httpx
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import patch, Mock, MagicMock
 from src.price_client import (
     get_hyperliquid_price,
+    get_hyperliquid_prices,
+    clear_cache,
+    reset_circuit,
+    RATE_LIMIT_MAX_SECONDS,
+    _backoff_delay,
+    _make_client,
     HyperLiquidAPIError,
     RateLimitError,
     InvalidPriceDataError,
@@ -11,16 +23,26 @@ from src.price_client import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_client_state():
+    """Each test starts with an empty price cache and a closed rate limit circuit."""
+    clear_cache()
+    reset_circuit()
+    yield
+    clear_cache()
+    reset_circuit()
+
+
 class TestNormalCase:
     """TC01: Normal Case (200 OK)"""
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     def test_normal_case_valid_price(self, mock_get):
         """TC01: Valid positive price should return float"""
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"price": 45000.75}
+        mock_response.content = orjson.dumps({"price": 45000.75})
         mock_get.return_value = mock_response
         
         # Act
@@ -30,33 +52,84 @@ class TestNormalCase:
         assert result == 45000.75
         assert isinstance(result, float)
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     def test_symbol_passed_to_api(self, mock_get):
         """Verify symbol parameter is included in API call"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"price": 45000.75}
+        mock_response.content = orjson.dumps({"price": 45000.75})
         mock_get.return_value = mock_response
         
         get_hyperliquid_price("ETH")
         
         # Verify API call includes symbol parameter
         mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert "params" in call_args[1]
-        assert call_args[1]["params"]["symbol"] == "ETH"
+        url = mock_get.call_args[0][0]
+        assert "symbol=ETH" in url
+        assert "type=spotPrice" in url
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_symbol_is_url_encoded(self, mock_get):
+        """Symbols with reserved characters must not break the query string"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"price": 1.5})
+        mock_get.return_value = mock_response
+        
+        get_hyperliquid_price("PURR/USDC")
+        
+        assert "symbol=PURR%2FUSDC&" in mock_get.call_args[0][0]
+    
+    def test_redirect_is_followed(self):
+        """A redirect to the price endpoint's new location is followed"""
+        def handler(request):
+            if request.url.path == "/info":
+                return httpx.Response(301, headers={"Location": f"/info/v2?{request.url.query.decode()}"})
+            return httpx.Response(200, content=orjson.dumps({"price": 45000.75}))
+        
+        with _make_client(httpx.MockTransport(handler)) as client:
+            with patch("src.price_client._CLIENT", client):
+                assert get_hyperliquid_price("BTC") == 45000.75
+    
+    @patch("src.price_client._request_with_retries")
+    @patch("src.price_client._CLIENT.get")
+    def test_success_skips_retry_handling(self, mock_get, mock_request_with_retries):
+        """A valid 200 OK is served without entering the retry/fallback path"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"price": 45000.75})
+        mock_get.return_value = mock_response
+        
+        assert get_hyperliquid_price("BTC") == 45000.75
+        mock_request_with_retries.assert_not_called()
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_success_logged_at_info(self, mock_get, caplog):
+        """Monitoring sees the fetch and its result at INFO level"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"price": 45000.75})
+        mock_get.return_value = mock_response
+        
+        with caplog.at_level("INFO", logger="src.price_client"):
+            get_hyperliquid_price("BTC")
+        
+        messages = [r.getMessage() for r in caplog.records if r.levelname == "INFO"]
+        assert "Fetching price for BTC (fallback enabled: False)" in messages
+        assert "Successfully fetched price for BTC: 45000.75" in messages
 
 
 class TestServerErrors:
     """TC02: API Down (500 Error) and TC07: Retry Exhaustion"""
     
-    @patch("src.price_client.requests.get")
-    @patch("src.price_client.time.sleep")
-    def test_server_error_retries_then_fails(self, mock_sleep, mock_get):
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client._backoff")
+    def test_server_error_retries_then_fails(self, mock_backoff, mock_get):
         """TC02: Server errors should retry N times then raise"""
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 502
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         # Act & Assert
@@ -65,9 +138,15 @@ class TestServerErrors:
         
         # Should retry MAX_RETRIES times
         assert mock_get.call_count == 3
-        assert mock_sleep.call_count == 2  # Sleep between retries
+        assert mock_backoff.call_count == 2  # Back off between retries
     
-    @patch("src.price_client.requests.get")
+    @pytest.mark.parametrize("attempt,base", [(1, 0.5), (2, 1.0), (3, 2.0), (10, 4.0)])
+    def test_backoff_delay_is_jittered_and_capped(self, attempt, base):
+        """Backoff grows exponentially up to a cap, with +/-50% jitter"""
+        for _ in range(20):
+            assert base * 0.5 <= _backoff_delay(attempt) < base * 1.5
+    
+    @patch("src.price_client._CLIENT.get")
     def test_immediate_failure_on_client_error(self, mock_get):
         """Client errors (400-499) should fail immediately without retry"""
         mock_response = Mock()
@@ -83,39 +162,52 @@ class TestServerErrors:
 class TestInvalidPriceData:
     """TC03: Invalid Price Data (negative, null, missing)"""
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     @pytest.mark.parametrize("test_input,expected_error", [
         # Negative price - CRITICAL
-        ({"price": -100.0}, "Invalid price value"),
+        ({"price": -100.0}, "Invalid price"),
         # Zero price - CRITICAL
-        ({"price": 0}, "Invalid price value"),
+        ({"price": 0}, "Invalid price"),
         # Non-numeric price - CRITICAL
-        ({"price": "invalid"}, "Price not numeric"),
+        ({"price": "invalid"}, "Invalid price"),
+        ({"price": {"value": 1}}, "Invalid price"),
+        ({"price": True}, "Invalid price"),
+        # Numeric string price - CRITICAL (spotPrice reports numbers)
+        ({"price": "45000.0"}, "Invalid price"),
+        ({"price": "1_000"}, "Invalid price"),
+        # Non-finite price - CRITICAL
+        ({"price": "NaN"}, "Invalid price"),
+        ({"price": "inf"}, "Invalid price"),
         # Missing price field - CRITICAL without fallback
         ({}, "Missing price field"),
+        # Valid JSON that is not an object - CRITICAL
+        (None, "Unexpected price response"),
+        ([{"price": 45000.0}], "Unexpected price response"),
+        ("45000.0", "Unexpected price response"),
     ])
     def test_invalid_price_data_critical(self, mock_get, test_input, expected_error):
         """TC03: Invalid data should raise exception (block trading)"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = test_input
+        mock_response.content = orjson.dumps(test_input)
         mock_get.return_value = mock_response
         
         with pytest.raises(InvalidPriceDataError, match=expected_error):
             get_hyperliquid_price("BTC", use_fallback=False)
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client.T_FRESH", 0)
+    @patch("src.price_client._CLIENT.get")
     def test_missing_price_with_fallback(self, mock_get):
         """Missing price with fallback enabled should use last known price"""
         # First call - valid price
         mock_response1 = Mock()
         mock_response1.status_code = 200
-        mock_response1.json.return_value = {"price": 50000.0}
+        mock_response1.content = orjson.dumps({"price": 50000.0})
         
         # Second call - missing price
         mock_response2 = Mock()
         mock_response2.status_code = 200
-        mock_response2.json.return_value = {}  # Missing price field
+        mock_response2.content = orjson.dumps({})  # Missing price field
         
         mock_get.side_effect = [mock_response1, mock_response2]
         
@@ -131,7 +223,7 @@ class TestInvalidPriceData:
 class TestRateLimiting:
     """TC04: Rate Limiting (429)"""
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     def test_rate_limit_with_retry_after(self, mock_get):
         """TC04: Rate limit should raise immediately with retry info"""
         mock_response = Mock()
@@ -146,7 +238,7 @@ class TestRateLimiting:
         assert "Rate limited" in str(exc_info.value)
         assert mock_get.call_count == 1  # No retry on rate limit
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     def test_rate_limit_without_retry_after(self, mock_get):
         """Rate limit without Retry-After header"""
         mock_response = Mock()
@@ -158,16 +250,151 @@ class TestRateLimiting:
             get_hyperliquid_price("BTC")
         
         assert exc_info.value.retry_after is None
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_rate_limit_with_http_date_retry_after(self, mock_get):
+        """Retry-After given as an HTTP-date is converted to seconds"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": format_datetime(retry_at, usegmt=True)}
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            get_hyperliquid_price("BTC")
+        
+        assert 28 <= exc_info.value.retry_after <= 31
+    
+    @patch("src.price_client._CLIENT.get")
+    @pytest.mark.parametrize("header", [
+        "0",
+        format_datetime(datetime(2020, 1, 1, tzinfo=timezone.utc), usegmt=True),
+    ])
+    def test_rate_limit_with_zero_retry_after(self, mock_get, header):
+        """Retry-After of zero (or a past date) reports 0 and does not hold the circuit"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 429
+        mock_response1.headers = {"Retry-After": header}
+        
+        mock_response2 = Mock()
+        mock_response2.status_code = 200
+        mock_response2.content = orjson.dumps({"price": 45000.0})
+        
+        mock_get.side_effect = [mock_response1, mock_response2]
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            get_hyperliquid_price("BTC")
+        
+        assert exc_info.value.retry_after == 0
+        assert get_hyperliquid_price("BTC") == 45000.0
+    
+    @patch("src.price_client._CLIENT.get")
+    @pytest.mark.parametrize("header", ["soon", "-5", ""])
+    def test_rate_limit_with_invalid_retry_after(self, mock_get, header):
+        """Unparseable Retry-After values are ignored"""
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": header}
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            get_hyperliquid_price("BTC")
+        
+        assert exc_info.value.retry_after is None
+    
+    def test_rate_limit_error_survives_pickling(self):
+        """retry_after is kept when the error crosses a process boundary"""
+        error = pickle.loads(pickle.dumps(RateLimitError("Rate limited for BTC", retry_after=30)))
+        
+        assert str(error) == "Rate limited for BTC"
+        assert error.retry_after == 30
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_rate_limit_opens_circuit(self, mock_get):
+        """After a 429, calls fail fast without hitting the API"""
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "30"}
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(RateLimitError):
+            get_hyperliquid_price("BTC")
+        
+        # Other symbols are blocked too: the limit is per client, not per symbol
+        with pytest.raises(RateLimitError, match="circuit open") as exc_info:
+            get_hyperliquid_price("ETH")
+        
+        assert 0 < exc_info.value.retry_after <= 30
+        assert mock_get.call_count == 1
+    
+    @patch("src.price_client._CLIENT.get")
+    @pytest.mark.parametrize("header", [
+        "999999999",
+        format_datetime(datetime(2999, 1, 1, tzinfo=timezone.utc), usegmt=True),
+    ])
+    def test_huge_retry_after_is_capped(self, mock_get, header):
+        """A far-off Retry-After holds the circuit for at most RATE_LIMIT_MAX_SECONDS"""
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": header}
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(RateLimitError):
+            get_hyperliquid_price("BTC")
+        
+        with pytest.raises(RateLimitError, match="circuit open") as exc_info:
+            get_hyperliquid_price("BTC")
+        
+        assert 0 < exc_info.value.retry_after <= RATE_LIMIT_MAX_SECONDS
+        assert mock_get.call_count == 1
+    
+    @patch("src.price_client.RATE_LIMIT_COOLDOWN_SECONDS", 0)
+    @patch("src.price_client._CLIENT.get")
+    def test_circuit_closes_after_cooldown(self, mock_get):
+        """Requests resume once the rate limit window has passed"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 429
+        mock_response1.headers = {}
+        
+        mock_response2 = Mock()
+        mock_response2.status_code = 200
+        mock_response2.content = orjson.dumps({"price": 45000.0})
+        
+        mock_get.side_effect = [mock_response1, mock_response2]
+        
+        with pytest.raises(RateLimitError):
+            get_hyperliquid_price("BTC")
+        
+        assert get_hyperliquid_price("BTC") == 45000.0
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_server_error_with_retry_after_is_honored(self, mock_get):
+        """503 with Retry-After should stop retrying and open the circuit"""
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.headers = {"Retry-After": "10"}
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            get_hyperliquid_price("BTC")
+        
+        assert exc_info.value.retry_after == 10
+        assert mock_get.call_count == 1
+        
+        with pytest.raises(RateLimitError, match="circuit open"):
+            get_hyperliquid_price("BTC")
+        
+        assert mock_get.call_count == 1
 
 
 class TestNetworkTimeout:
     """TC05: Network Timeout"""
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     @patch("src.price_client.time.sleep")
     def test_timeout_retry_exhausted(self, mock_sleep, mock_get):
         """TC05: Timeout should retry then fail"""
-        mock_get.side_effect = requests.exceptions.Timeout("Request timeout")
+        mock_get.side_effect = httpx.TimeoutException("Request timeout")
         
         with pytest.raises(RetryExhaustedError, match="Failed to get price"):
             get_hyperliquid_price("BTC")
@@ -175,16 +402,16 @@ class TestNetworkTimeout:
         assert mock_get.call_count == 3
         assert mock_sleep.call_count == 2
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     @patch("src.price_client.time.sleep")
     def test_timeout_recovery_on_second_attempt(self, mock_sleep, mock_get):
         """Timeout on first attempt, success on second"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"price": 45000.0}
+        mock_response.content = orjson.dumps({"price": 45000.0})
         
         mock_get.side_effect = [
-            requests.exceptions.Timeout("First attempt timeout"),
+            httpx.TimeoutException("First attempt timeout"),
             mock_response
         ]
         
@@ -196,12 +423,12 @@ class TestNetworkTimeout:
 class TestInvalidJSON:
     """TC06: Invalid JSON Response"""
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     def test_invalid_json_response(self, mock_get):
         """TC06: Malformed JSON should raise immediately"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"{not json"
         mock_get.return_value = mock_response
         
         with pytest.raises(InvalidPriceDataError, match="Invalid JSON response"):
@@ -211,12 +438,13 @@ class TestInvalidJSON:
 class TestRetryExhaustion:
     """TC07: Retry Exhaustion"""
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     @patch("src.price_client.time.sleep")
     def test_all_retries_exhausted_server_error(self, mock_sleep, mock_get):
         """TC07: All retries exhausted on persistent server errors"""
         mock_response = Mock()
         mock_response.status_code = 503
+        mock_response.headers = {}
         mock_get.return_value = mock_response
         
         with pytest.raises(RetryExhaustedError, match="after 3 attempts"):
@@ -224,46 +452,96 @@ class TestRetryExhaustion:
         
         assert mock_get.call_count == 3
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     @patch("src.price_client.time.sleep")
     def test_retry_exhaustion_mixed_errors(self, mock_sleep, mock_get):
         """Retry exhaustion with different error types"""
         mock_get.side_effect = [
-            requests.exceptions.Timeout("Timeout 1"),
-            requests.exceptions.ConnectionError("Connection lost"),
-            Mock(status_code=500)  # Server error
+            httpx.TimeoutException("Timeout 1"),
+            httpx.ConnectError("Connection lost"),
+            Mock(status_code=500, headers={})  # Server error
         ]
         
         with pytest.raises(RetryExhaustedError):
             get_hyperliquid_price("BTC")
+    
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client._backoff")
+    def test_endpoint_marked_down_fails_fast(self, mock_backoff, mock_get):
+        """After persistent server errors, calls fail without retrying"""
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        
+        with pytest.raises(RetryExhaustedError, match="after 3 attempts"):
+            get_hyperliquid_price("BTC")
+        
+        with pytest.raises(RetryExhaustedError, match="marked down"):
+            get_hyperliquid_price("ETH")
+        
+        assert mock_get.call_count == 3
+    
+    @patch("src.price_client.T_FRESH", 0)
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client._backoff")
+    def test_endpoint_down_serves_stale_with_fallback(self, mock_backoff, mock_get):
+        """Fallback mode serves the stale price while the endpoint is down"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 200
+        mock_response1.content = orjson.dumps({"price": 45000.0})
+        
+        mock_get.side_effect = [mock_response1] + [Mock(status_code=503, headers={})] * 3
+        
+        get_hyperliquid_price("BTC", use_fallback=True)
+        assert get_hyperliquid_price("BTC", use_fallback=True) == 45000.0
+        assert get_hyperliquid_price("BTC", use_fallback=True) == 45000.0
+        
+        assert mock_get.call_count == 4
+    
+    @patch("src.price_client.ENDPOINT_DOWN_SECONDS", 0)
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client._backoff")
+    def test_endpoint_recovers_after_down_window(self, mock_backoff, mock_get):
+        """Requests resume once the endpoint-down window has passed"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"price": 45000.0})
+        
+        mock_get.side_effect = [Mock(status_code=503, headers={})] * 3 + [mock_response]
+        
+        with pytest.raises(RetryExhaustedError):
+            get_hyperliquid_price("BTC")
+        
+        assert get_hyperliquid_price("BTC") == 45000.0
 
 
 class TestEdgeCases:
     """Additional edge cases"""
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     def test_large_price_value(self, mock_get):
         """Handle very large price values"""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"price": 1e6}  # 1 million
+        mock_response.content = orjson.dumps({"price": 1e6})  # 1 million
         mock_get.return_value = mock_response
         
         result = get_hyperliquid_price("BTC")
         assert result == 1000000.0
     
-    @patch("src.price_client.requests.get")
+    @patch("src.price_client._CLIENT.get")
     def test_multiple_symbols_caching(self, mock_get):
         """Test caching works independently for different symbols"""
         # Mock BTC price
         mock_response_btc = Mock()
         mock_response_btc.status_code = 200
-        mock_response_btc.json.return_value = {"price": 50000.0}
+        mock_response_btc.content = orjson.dumps({"price": 50000.0})
         
         # Mock ETH price
         mock_response_eth = Mock()
         mock_response_eth.status_code = 200
-        mock_response_eth.json.return_value = {"price": 3000.0}
+        mock_response_eth.content = orjson.dumps({"price": 3000.0})
         
         mock_get.side_effect = [mock_response_btc, mock_response_eth]
         
@@ -276,4 +554,316 @@ class TestEdgeCases:
         assert eth_price == 3000.0
         
         # Each symbol should have independent cache
-        assert mock_get.call_count == 2
\ No newline at end of file
+        assert mock_get.call_count == 2
+
+
+class TestPriceCache:
+    """TTL cache with stale-while-revalidate"""
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_fresh_price_served_without_api_call(self, mock_get):
+        """Repeat calls within T_FRESH should not hit the API"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"price": 45000.0})
+        mock_get.return_value = mock_response
+        
+        assert get_hyperliquid_price("BTC") == 45000.0
+        assert get_hyperliquid_price("BTC") == 45000.0
+        
+        assert mock_get.call_count == 1
+    
+    @patch("src.price_client.T_FRESH", 0)
+    @patch("src.price_client._CLIENT.get")
+    def test_expired_price_refetched(self, mock_get):
+        """Calls after T_FRESH should fetch a new price"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 200
+        mock_response1.content = orjson.dumps({"price": 45000.0})
+        
+        mock_response2 = Mock()
+        mock_response2.status_code = 200
+        mock_response2.content = orjson.dumps({"price": 46000.0})
+        
+        mock_get.side_effect = [mock_response1, mock_response2]
+        
+        assert get_hyperliquid_price("BTC") == 45000.0
+        assert get_hyperliquid_price("BTC") == 46000.0
+    
+    @patch("src.price_client.T_FRESH", 0)
+    @patch("src.price_client._CLIENT.get")
+    def test_stale_price_served_on_rate_limit_with_fallback(self, mock_get):
+        """Rate limit with fallback enabled should serve the stale price"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 200
+        mock_response1.content = orjson.dumps({"price": 45000.0})
+        
+        mock_response2 = Mock()
+        mock_response2.status_code = 429
+        mock_response2.headers = {}
+        
+        mock_get.side_effect = [mock_response1, mock_response2]
+        
+        get_hyperliquid_price("BTC", use_fallback=True)
+        assert get_hyperliquid_price("BTC", use_fallback=True) == 45000.0
+    
+    @patch("src.price_client.T_FRESH", 0)
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client.time.sleep")
+    def test_stale_price_not_served_without_fallback(self, mock_sleep, mock_get):
+        """Critical mode must not fall back to a stale price"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 200
+        mock_response1.content = orjson.dumps({"price": 45000.0})
+        
+        mock_get.side_effect = [mock_response1] + [Mock(status_code=503, headers={})] * 3
+        
+        get_hyperliquid_price("BTC")
+        with pytest.raises(RetryExhaustedError):
+            get_hyperliquid_price("BTC")
+    
+    @patch("src.price_client.T_FRESH", 0)
+    @patch("src.price_client.T_STALE", 0)
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client.time.sleep")
+    def test_expired_stale_price_not_served(self, mock_sleep, mock_get):
+        """Prices older than T_STALE are never used as a fallback"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 200
+        mock_response1.content = orjson.dumps({"price": 45000.0})
+        
+        mock_get.side_effect = [mock_response1] + [Mock(status_code=503, headers={})] * 3
+        
+        get_hyperliquid_price("BTC", use_fallback=True)
+        with pytest.raises(RetryExhaustedError):
+            get_hyperliquid_price("BTC", use_fallback=True)
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_cache_shared_across_threads(self, mock_get):
+        """Concurrent callers populate and read the cache consistently"""
+        symbols = [f"SYM{i}" for i in range(64)]
+        
+        def respond(url):
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = orjson.dumps({"price": float(url.split("SYM")[1].split("&")[0]) + 1})
+            return mock_response
+        
+        mock_get.side_effect = respond
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            first = list(pool.map(get_hyperliquid_price, symbols))
+            second = list(pool.map(get_hyperliquid_price, symbols))
+        
+        assert first == second == [float(i) + 1 for i in range(64)]
+        assert mock_get.call_count == 64  # Second pass served from cache
+
+
+class TestSingleFlight:
+    """Concurrent duplicate fetches share one API call"""
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_waits_for_inflight_fetch(self, mock_get):
+        """A caller joining an in-progress fetch gets its result without an API call"""
+        future = Future()
+        future.set_result(45000.0)
+        
+        with patch.dict("src.price_client._inflight", {("BTC", False): future}):
+            assert get_hyperliquid_price("BTC") == 45000.0
+        
+        mock_get.assert_not_called()
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_inflight_fallback_fetch_not_shared_with_critical_caller(self, mock_get):
+        """Critical callers never join a fetch that may return a fallback price"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"price": 46000.0})
+        mock_get.return_value = mock_response
+        
+        future = Future()
+        future.set_result(45000.0)
+        
+        with patch.dict("src.price_client._inflight", {("BTC", True): future}):
+            assert get_hyperliquid_price("BTC", use_fallback=False) == 46000.0
+        
+        mock_get.assert_called_once()
+    
+    @patch("src.price_client._CLIENT.get")
+    def test_inflight_entry_released_after_failure(self, mock_get):
+        """A failed fetch is propagated and does not block later fetches"""
+        mock_response1 = Mock()
+        mock_response1.status_code = 404
+        
+        mock_response2 = Mock()
+        mock_response2.status_code = 200
+        mock_response2.content = orjson.dumps({"price": 45000.0})
+        
+        mock_get.side_effect = [mock_response1, mock_response2]
+        
+        with pytest.raises(HyperLiquidAPIError, match="Client error"):
+            get_hyperliquid_price("BTC")
+        
+        assert get_hyperliquid_price("BTC") == 45000.0
+    
+    @patch("src.price_client._max_fetch_seconds", return_value=0.01)
+    def test_waiter_timeout_raises_retry_exhausted(self, mock_max_fetch_seconds):
+        """A waiter whose in-flight fetch never finishes fails like an exhausted fetch"""
+        with patch.dict("src.price_client._inflight", {("BTC", False): Future()}):
+            with pytest.raises(RetryExhaustedError, match="in-flight fetch of BTC") as exc_info:
+                get_hyperliquid_price("BTC")
+        
+        assert isinstance(exc_info.value.__cause__, TimeoutError)
+    
+    def run_concurrent_callers(self, response, callers=8):
+        """Run callers for BTC while the first one's API call is blocked; return outcomes and the mock."""
+        entered = threading.Event()
+        release = threading.Event()
+        joined = threading.Semaphore(0)
+        
+        class JoinCountingFuture(Future):
+            def exception(self, timeout=None):
+                joined.release()  # a waiter is about to block on this fetch
+                return super().exception(timeout)
+        
+        def blocking_get(url):
+            entered.set()
+            release.wait(5)
+            return response
+        
+        def call():
+            try:
+                return get_hyperliquid_price("BTC")
+            except HyperLiquidAPIError as e:
+                return e
+        
+        with patch("src.price_client.Future", JoinCountingFuture), \
+                patch("src.price_client._CLIENT.get", side_effect=blocking_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=callers) as pool:
+                owner = pool.submit(call)
+                assert entered.wait(5)
+                waiters = [pool.submit(call) for _ in range(callers - 1)]
+                for _ in waiters:
+                    assert joined.acquire(timeout=5)
+                release.set()
+                outcomes = [owner.result()] + [waiter.result() for waiter in waiters]
+        
+        return outcomes, mock_get
+    
+    def test_concurrent_callers_share_result(self):
+        """N concurrent callers trigger one API call and all get its price"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"price": 45000.0})
+        
+        outcomes, mock_get = self.run_concurrent_callers(mock_response)
+        
+        assert mock_get.call_count == 1
+        assert outcomes == [45000.0] * 8
+    
+    def test_concurrent_callers_share_failure(self):
+        """N concurrent callers trigger one API call and all see its error"""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        
+        outcomes, mock_get = self.run_concurrent_callers(mock_response)
+        
+        assert mock_get.call_count == 1
+        owner_error, waiter_errors = outcomes[0], outcomes[1:]
+        assert all(type(error) is HyperLiquidAPIError for error in outcomes)
+        assert all(str(error) == "Client error 404 for BTC" for error in outcomes)
+        # Each waiter gets its own exception, chained to the owner's
+        assert len({id(error) for error in outcomes}) == 8
+        assert all(error.__cause__ is owner_error for error in waiter_errors)
+
+
+class TestBatchPrices:
+    """Bulk fetch through the allMids endpoint"""
+    
+    @patch("src.price_client._CLIENT.post")
+    def test_single_request_for_all_symbols(self, mock_post):
+        """All requested symbols come from one allMids call"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"BTC": "45000.5", "ETH": "3000.25", "SOL": "150.0"})
+        mock_post.return_value = mock_response
+        
+        result = get_hyperliquid_prices(["BTC", "ETH"])
+        
+        assert result == {"BTC": 45000.5, "ETH": 3000.25}
+        mock_post.assert_called_once()
+        assert orjson.loads(mock_post.call_args[1]["content"]) == {"type": "allMids"}
+    
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client._CLIENT.post")
+    def test_batch_populates_cache(self, mock_post, mock_get):
+        """Prices from a batch fetch are served to single-symbol callers"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"BTC": "45000.5", "ETH": "3000.25"})
+        mock_post.return_value = mock_response
+        
+        get_hyperliquid_prices(["BTC", "ETH"])
+        
+        assert get_hyperliquid_price("ETH") == 3000.25
+        assert get_hyperliquid_prices(["BTC", "ETH"]) == {"BTC": 45000.5, "ETH": 3000.25}
+        assert mock_post.call_count == 1
+        mock_get.assert_not_called()
+    
+    @patch("src.price_client._CLIENT.post")
+    @pytest.mark.parametrize("mids,expected_error", [
+        ({"BTC": "45000.5"}, "Missing price field for ETH"),
+        ({"BTC": "45000.5", "ETH": "invalid"}, "Invalid price for ETH"),
+        ({"BTC": "45000.5", "ETH": "0"}, "Invalid price for ETH"),
+        ({"BTC": "45000.5", "ETH": "-1.5"}, "Invalid price for ETH"),
+        (["BTC", "ETH"], "Unexpected allMids response"),
+        ({"BTC": "45000.5", "ETH": "nan"}, "Invalid price for ETH"),
+        ({"BTC": "45000.5", "ETH": "1_000"}, "Invalid price for ETH"),
+        ({"BTC": "45000.5", "ETH": " 12 "}, "Invalid price for ETH"),
+        ({"BTC": "45000.5", "ETH": "1e3"}, "Invalid price for ETH"),
+    ])
+    def test_invalid_price_blocks_whole_batch(self, mock_post, mids, expected_error):
+        """TC03: A single invalid price blocks the whole batch"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(mids)
+        mock_post.return_value = mock_response
+        
+        with pytest.raises(InvalidPriceDataError, match=expected_error):
+            get_hyperliquid_prices(["BTC", "ETH"])
+    
+    @patch("src.price_client._CLIENT.post")
+    @patch("src.price_client._backoff")
+    def test_server_error_retries_then_fails(self, mock_backoff, mock_post):
+        """TC02: Batch requests retry server errors like single fetches"""
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.headers = {}
+        mock_post.return_value = mock_response
+        
+        with pytest.raises(RetryExhaustedError, match="after 3 attempts"):
+            get_hyperliquid_prices(["BTC", "ETH"])
+        
+        assert mock_post.call_count == 3
+    
+    @patch("src.price_client._CLIENT.post")
+    def test_rate_limit_raises_immediately(self, mock_post):
+        """TC04: Rate limit on a batch raises with retry info"""
+        mock_response = Mock()
+        mock_response.status_code = 429
+        mock_response.headers = {"Retry-After": "30"}
+        mock_post.return_value = mock_response
+        
+        with pytest.raises(RateLimitError) as exc_info:
+            get_hyperliquid_prices(["BTC", "ETH"])
+        
+        assert exc_info.value.retry_after == 30
+        assert mock_post.call_count == 1
+    
+    @patch("src.price_client._CLIENT.post")
+    def test_single_string_rejected(self, mock_post):
+        """A bare symbol string is not split into one-letter symbols"""
+        with pytest.raises(TypeError, match="not a string"):
+            get_hyperliquid_prices("BTC")
+        
+        mock_post.assert_not_called()
\ No newline at end of file
@@ -0,0 +1,202 @@
+import asyncio
+import orjson
+import pytest
+import time
+from unittest.mock import patch, MagicMock, AsyncMock
+from src.price_client_async import get_prices, get_prices_sync
+from src.price_client import (
+    get_hyperliquid_price,
+    reset_circuit,
+    HyperLiquidAPIError,
+    RateLimitError,
+    InvalidPriceDataError,
+    RetryExhaustedError,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit_circuit():
+    """The rate limit circuit is shared with the sync client: start each test closed."""
+    reset_circuit()
+    yield
+    reset_circuit()
+
+
+def make_response(status, json_data=None, headers=None):
+    """Build a mock aiohttp response usable as an async context manager."""
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read = AsyncMock(return_value=orjson.dumps(json_data))
+    response.__aenter__.return_value = response
+    return response
+
+
+class TestBatchNormalCase:
+    """TC01: Normal Case (200 OK) for several symbols"""
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_prices_for_all_symbols(self, mock_get):
+        """Each requested symbol maps to its own price"""
+        prices = {"BTC": 45000.75, "ETH": 3000.0}
+        mock_get.side_effect = lambda url, params: make_response(200, {"price": prices[params["symbol"]]})
+
+        result = get_prices_sync(["BTC", "ETH"])
+
+        assert result == prices
+        assert mock_get.call_count == 2
+
+
+class TestBatchFailures:
+    """TC02-TC07 applied to batched fetches"""
+
+    @patch("src.price_client_async.asyncio.sleep", new_callable=AsyncMock)
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_server_error_retries_then_fails(self, mock_get, mock_sleep):
+        """TC02: Server errors should retry N times then raise"""
+        mock_get.return_value = make_response(502)
+
+        with pytest.raises(RetryExhaustedError, match="Failed to get price"):
+            get_prices_sync(["BTC"])
+
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_rate_limit_raises_immediately(self, mock_get):
+        """TC04: Rate limit should raise with retry info, no retry"""
+        mock_get.return_value = make_response(429, headers={"Retry-After": "30"})
+
+        with pytest.raises(RateLimitError) as exc_info:
+            get_prices_sync(["BTC"])
+
+        assert exc_info.value.retry_after == 30
+        assert mock_get.call_count == 1
+
+    @patch("src.price_client_async.asyncio.sleep", new_callable=AsyncMock)
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_timeout_recovery_on_second_attempt(self, mock_get, mock_sleep):
+        """TC05: Timeout on first attempt, success on second"""
+        mock_get.side_effect = [asyncio.TimeoutError(), make_response(200, {"price": 45000.0})]
+
+        assert get_prices_sync(["BTC"]) == {"BTC": 45000.0}
+        assert mock_get.call_count == 2
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_one_invalid_price_fails_whole_batch(self, mock_get):
+        """TC03: A single invalid price blocks the whole batch"""
+        prices = {"BTC": 45000.75, "ETH": -1}
+        mock_get.side_effect = lambda url, params: make_response(200, {"price": prices[params["symbol"]]})
+
+        with pytest.raises(InvalidPriceDataError, match="Invalid price"):
+            get_prices_sync(["BTC", "ETH"])
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_invalid_json_response(self, mock_get):
+        """TC06: Malformed JSON should raise immediately"""
+        response = make_response(200)
+        response.read = AsyncMock(return_value=b"{not json")
+        mock_get.return_value = response
+
+        with pytest.raises(InvalidPriceDataError, match="Invalid JSON response"):
+            get_prices_sync(["BTC"])
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    @pytest.mark.parametrize("body", [None, [{"price": 45000.0}], "45000.0"])
+    def test_non_object_response(self, mock_get, body):
+        """TC03: Valid JSON that is not an object is invalid price data"""
+        mock_get.return_value = make_response(200, body)
+
+        with pytest.raises(InvalidPriceDataError, match="Unexpected price response"):
+            get_prices_sync(["BTC"])
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_immediate_failure_on_client_error(self, mock_get):
+        """Client errors (400-499) should fail immediately without retry"""
+        mock_get.return_value = make_response(404)
+
+        with pytest.raises(HyperLiquidAPIError, match="Client error"):
+            get_prices_sync(["BTC"])
+
+        assert mock_get.call_count == 1
+
+
+class TestBatchRateLimitCircuit:
+    """Rate limit circuit breaker shared with the sync client"""
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_open_circuit_blocks_requests(self, mock_get):
+        """No request is sent while the circuit is open"""
+        with patch("src.price_client._rate_limit_until", time.monotonic() + 60):
+            with pytest.raises(RateLimitError, match="circuit open"):
+                get_prices_sync(["BTC", "ETH"])
+
+        mock_get.assert_not_called()
+
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_rate_limit_opens_circuit_for_sync_callers(self, mock_get, mock_sync_get):
+        """A 429 seen by the async client blocks sync callers too"""
+        mock_get.return_value = make_response(429, headers={"Retry-After": "30"})
+
+        with pytest.raises(RateLimitError):
+            get_prices_sync(["BTC"])
+
+        with pytest.raises(RateLimitError, match="circuit open"):
+            get_hyperliquid_price("ETH")
+
+        mock_sync_get.assert_not_called()
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_rate_limit_stops_queued_requests(self, mock_get):
+        """Requests waiting for a slot are not sent after a 429"""
+        mock_get.return_value = make_response(429)
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(get_prices(["BTC", "ETH", "SOL"], concurrency=1))
+
+        assert mock_get.call_count == 1
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_server_error_with_retry_after_is_honored(self, mock_get):
+        """503 with Retry-After should stop retrying and open the circuit"""
+        mock_get.return_value = make_response(503, headers={"Retry-After": "10"})
+
+        with pytest.raises(RateLimitError) as exc_info:
+            get_prices_sync(["BTC"])
+
+        assert exc_info.value.retry_after == 10
+        assert mock_get.call_count == 1
+
+        with pytest.raises(RateLimitError, match="circuit open"):
+            get_prices_sync(["BTC"])
+
+        assert mock_get.call_count == 1
+
+
+class TestBatchEndpointDown:
+    """TC07: Endpoint-down flag shared with the sync client"""
+
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_endpoint_down_blocks_requests(self, mock_get):
+        """No request is sent while the sync client has the endpoint marked down"""
+        with patch("src.price_client._endpoint_down_until", time.monotonic() + 60):
+            with pytest.raises(RetryExhaustedError, match="Endpoint marked down"):
+                get_prices_sync(["BTC", "ETH"])
+
+        mock_get.assert_not_called()
+
+    @patch("src.price_client._CLIENT.get")
+    @patch("src.price_client_async.asyncio.sleep", new_callable=AsyncMock)
+    @patch("src.price_client_async.aiohttp.ClientSession.get")
+    def test_exhausted_retries_mark_endpoint_down(self, mock_get, mock_sleep, mock_sync_get):
+        """Persistent server errors seen by the async client make sync callers fail fast"""
+        mock_get.return_value = make_response(502)
+
+        with pytest.raises(RetryExhaustedError, match="Failed to get price"):
+            get_prices_sync(["BTC"])
+
+        with pytest.raises(RetryExhaustedError, match="Endpoint marked down"):
+            get_hyperliquid_price("ETH")
+
+        mock_sync_get.assert_not_called()